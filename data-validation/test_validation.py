@@ -6,22 +6,36 @@ These tests validate the data transformation pipeline output.
 Run with: pytest test_validation.py -v
 
 Prerequisites:
-    pip install pytest pandas
+    pip install pytest pytest-xdist pandas pyarrow
 """
 
 import pytest
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import os
+import re
+import subprocess
+import sys
 from pathlib import Path
 
 # Import validator module
 from validator import (
+    load_csv,
+    any_duplicates,
     validate_text_case,
     validate_no_nulls,
     validate_no_duplicates,
-    validate_sorted,
     validate_row_count,
-    validate_schema
+    validate_sorted,
+    validate_schema,
+    validate_email_format,
+    run_all_validations,
+    run_all_validations_fused,
+    make_validator,
+    EMAIL_PATTERN,
+    EXPECTED_LAYOUT
 )
 
 
@@ -30,15 +44,27 @@ PROJECT_ROOT = Path(__file__).parent.parent
 MESSY_CSV = PROJECT_ROOT / "assets" / "messy.csv"
 CLEANED_CSV = PROJECT_ROOT / "test-results" / "downloads" / "cleaned_data.csv"
 
+# Allowed values for the categorical columns
+VALID_DEPTS = frozenset({'Engineering', 'Marketing', 'HR', 'Sales'})
+VALID_STATUSES = frozenset({'active', 'inactive'})
+
+
+# Session-scoped so each CSV is parsed once per run; tests must not mutate them
+@pytest.fixture(scope="session")
+def messy_df():
+    """Load the messy CSV file."""
+    return load_csv(MESSY_CSV)
+
+
+@pytest.fixture(scope="session")
+def cleaned_df():
+    """Load the cleaned CSV file."""
+    return load_csv(CLEANED_CSV)
+
 
 class TestMessyDataValidation:
     """Tests to verify our messy.csv has the expected quality issues."""
     
-    @pytest.fixture
-    def messy_df(self):
-        """Load the messy CSV file."""
-        return pd.read_csv(MESSY_CSV)
-    
     def test_messy_csv_exists(self):
         """Verify messy.csv exists in assets folder."""
         assert MESSY_CSV.exists(), f"messy.csv not found at {MESSY_CSV}"
@@ -57,17 +83,42 @@ class TestMessyDataValidation:
         null_count = messy_df['salary'].isna().sum()
         assert null_count > 0, "Expected NULL values in salary column"
     
+    def test_messy_null_counts_are_reported(self, messy_df):
+        """Verify validate_no_nulls reports the 5 NULLs in each of age and salary."""
+        passed, message = validate_no_nulls(messy_df)
+        assert not passed
+        assert message == "✗ age: 5 NULL values found\n✗ salary: 5 NULL values found"
+    
+    def test_messy_null_check_other_columns(self, messy_df):
+        """Verify validate_no_nulls passes complete columns and flags missing ones."""
+        assert validate_no_nulls(messy_df, ['name']) == (True, "✓ name: No NULL values")
+        passed, message = validate_no_nulls(messy_df, ['age', 'nope'])
+        assert not passed
+        assert message == "✗ age: 5 NULL values found\nColumn 'nope' not found"
+    
+    def test_messy_numeric_columns_are_downcast(self, messy_df):
+        """Verify load_csv narrows id and keeps the NULLs in age."""
+        assert str(messy_df['id'].dtype) == 'int32[pyarrow]'
+        ages = messy_df['age'].to_numpy(dtype=np.float64, na_value=np.nan)
+        assert np.isnan(ages).sum() == messy_df['age'].isna().sum() == 5
+    
     def test_messy_has_mixed_case_status(self, messy_df):
         """Verify messy.csv has mixed case in status column."""
-        unique_statuses = messy_df['status'].unique()
+        unique_statuses = np.asarray(messy_df['status'].unique(), dtype=str)
         # Should have Active, ACTIVE, active, Inactive, INACTIVE, inactive
-        has_mixed_case = len(set(s.lower() for s in unique_statuses)) < len(unique_statuses)
+        has_mixed_case = len(np.unique(np.char.lower(unique_statuses))) < len(unique_statuses)
         assert has_mixed_case, "Expected mixed case values in status column"
     
     def test_messy_has_duplicates(self, messy_df):
         """Verify messy.csv has at least one duplicate row."""
-        duplicate_count = messy_df.duplicated().sum()
-        assert duplicate_count > 0, "Expected at least one duplicate row"
+        assert any_duplicates(messy_df), "Expected at least one duplicate row"
+    
+    def test_messy_is_not_sorted(self, messy_df):
+        """Verify messy.csv is not sorted by name and the first bad row is reported."""
+        passed, message = validate_sorted(messy_df, 'name', ascending=True)
+        assert not passed, "Expected messy.csv to be unsorted by name"
+        # "John Doe" sits in row 1 but "Alice Brown" sorts first
+        assert message.endswith("(first out-of-place row: 1)"), message
 
 
 @pytest.mark.skipif(
@@ -77,11 +128,6 @@ class TestMessyDataValidation:
 class TestCleanedDataValidation:
     """Tests to validate the transformed/cleaned data output."""
     
-    @pytest.fixture
-    def cleaned_df(self):
-        """Load the cleaned CSV file."""
-        return pd.read_csv(CLEANED_CSV)
-    
     def test_schema_matches_expected(self, cleaned_df):
         """Verify schema has all expected columns."""
         passed, message = validate_schema(cleaned_df)
@@ -119,18 +165,16 @@ class TestCleanedDataValidation:
     
     def test_status_values_are_valid(self, cleaned_df):
         """Verify status only contains 'active' or 'inactive'."""
-        valid_values = {'active', 'inactive'}
-        actual_values = set(cleaned_df['status'].str.lower().unique())
-        assert actual_values.issubset(valid_values), f"Invalid status values: {actual_values - valid_values}"
+        # Lowercase and dedupe the categories with Arrow kernels; only the
+        # handful of distinct values ever reaches Python
+        statuses = pa.array(cleaned_df['status'].cat.categories)
+        actual_values = set(pc.unique(pc.utf8_lower(statuses)).to_pylist())
+        assert actual_values <= VALID_STATUSES, f"Invalid status values: {actual_values - VALID_STATUSES}"
 
 
 class TestDataIntegrity:
     """Tests for overall data integrity."""
     
-    @pytest.fixture
-    def messy_df(self):
-        return pd.read_csv(MESSY_CSV)
-    
     def test_id_is_unique(self, messy_df):
         """Verify each row has a unique ID (before deduplication)."""
         # Note: After deduplication, IDs should be unique
@@ -139,16 +183,187 @@ class TestDataIntegrity:
     
     def test_email_format(self, messy_df):
         """Verify email column contains valid email format."""
-        import re
-        email_pattern = r'^[\w\.-]+@[\w\.-]+\.\w+$'
-        invalid_emails = messy_df[~messy_df['email'].str.match(email_pattern)]
-        assert len(invalid_emails) == 0, f"Found {len(invalid_emails)} invalid emails"
+        passed, message = validate_email_format(messy_df, 'email')
+        assert passed, message
+    
+    def test_email_format_arrow_column_matches_re(self):
+        """Verify the Arrow/RE2 email path agrees with re, including non-ASCII input."""
+        emails = ['josé@exämple.com', 'é@ü.de', 'a@b.co\n', 'a_1@b-c.org',
+                  'a@b.co\nx', 'not-an-email', 'a@b', '', None]
+        arrow = pd.Series(emails, dtype=pd.ArrowDtype(pa.string()))
+        plain = pd.Series(emails, dtype=object)
+        expected = sum(1 for e in emails if e is None or not re.match(EMAIL_PATTERN, e))
+        assert expected == 5
+        df_arrow, df_plain = pd.DataFrame({'email': arrow}), pd.DataFrame({'email': plain})
+        assert validate_email_format(df_arrow) == (False, f"✗ Found {expected} invalid emails")
+        assert validate_email_format(df_arrow) == validate_email_format(df_plain)
+    
+    @pytest.mark.parametrize("use_hyperscan", [True, False])
+    def test_email_format_object_column(self, messy_df, monkeypatch, use_hyperscan):
+        """Verify the Hyperscan and plain-re email paths count invalid emails alike."""
+        import validator
+        if use_hyperscan:
+            pytest.importorskip("hyperscan")
+        else:
+            monkeypatch.setattr(validator, 'hyperscan', None)
+        emails = list(messy_df['email']) + ['not-an-email', None]
+        df = pd.DataFrame({'email': pd.Series(emails, dtype=object)})
+        assert validate_email_format(df, 'email') == (False, "✗ Found 2 invalid emails")
     
     def test_department_values(self, messy_df):
         """Verify department contains only valid values."""
-        valid_depts = {'Engineering', 'Marketing', 'HR', 'Sales'}
-        actual_depts = set(messy_df['department'].unique())
-        assert actual_depts.issubset(valid_depts), f"Invalid departments: {actual_depts - valid_depts}"
+        actual_depts = set(messy_df['department'].cat.categories)
+        assert actual_depts <= VALID_DEPTS, f"Invalid departments: {actual_depts - VALID_DEPTS}"
+    
+    def test_load_csv_callers_do_not_share_frames(self):
+        """Verify changing one loaded frame doesn't leak into later loads."""
+        df = load_csv(MESSY_CSV)
+        df['status'] = 'x'
+        df.loc[0, 'name'] = 'Changed'
+        fresh = load_csv(MESSY_CSV)
+        assert (fresh['status'] != 'x').all()
+        assert fresh.loc[0, 'name'] == 'John Doe'
+    
+    def test_header_only_csv_is_reported(self, tmp_path):
+        """Verify a header-only file (a failed pipeline run) fails ROW_COUNT instead of crashing."""
+        csv = tmp_path / "empty.csv"
+        csv.write_text(",".join(EXPECTED_LAYOUT) + "\n")
+        df = load_csv(csv)
+        results = make_validator(EXPECTED_LAYOUT)(df)
+        assert results == run_all_validations(df)
+        assert results['row_count'] == (False, "✗ Row count: 0 (expected 24-25)")
+        assert results['schema'][0] and results['text_case'][0]
+    
+    def test_duplicate_headers_are_renamed(self, tmp_path):
+        """Verify repeated headers are renamed like the C parser and reported as extra."""
+        csv = tmp_path / "dup_headers.csv"
+        csv.write_text(",".join(EXPECTED_LAYOUT) + ",status\n"
+                       "1,John Doe,john.doe@example.com,28,52000,Engineering,active,x\n")
+        df = load_csv(csv)
+        assert list(df.columns) == list(EXPECTED_LAYOUT) + ['status.1']
+        results = run_all_validations_fused(df)
+        assert results == run_all_validations(df)
+        assert results['schema'] == (False, "✗ Schema mismatch:\n  Extra: {'status.1'}")
+    
+    def test_all_empty_categorical_column_is_reported(self, tmp_path):
+        """Verify a category column with no values loads and fails its checks."""
+        csv = tmp_path / "blank_status.csv"
+        csv.write_text(",".join(EXPECTED_LAYOUT) + "\n"
+                       "1,John Doe,john.doe@example.com,28,52000,Engineering,\n")
+        results = run_all_validations(load_csv(csv))
+        assert results['text_case'] == (False, "Found 1 rows with non-lowercase status")
+    
+    def test_mixed_type_values_are_not_duplicates(self):
+        """Verify 1 and '1' in an object column are distinct rows, as duplicated() says."""
+        df = pd.DataFrame({'a': pd.Series([1, '1'], dtype=object)})
+        passed, message = validate_no_duplicates(df)
+        assert passed, message
+        assert not any_duplicates(df)
+    
+    def test_salaries_differing_by_cents_are_not_duplicates(self, tmp_path):
+        """Verify large salaries keep their cents so distinct rows stay distinct."""
+        csv = tmp_path / "salaries.csv"
+        csv.write_text(
+            "id,name,salary\n"
+            "1,John Doe,1234567.01\n"
+            "1,John Doe,1234567.02\n"
+        )
+        passed, message = validate_no_duplicates(load_csv(csv))
+        assert passed, message
+    
+    def test_unnarrowable_values_still_load(self, tmp_path):
+        """Verify ids past int32 and non-numeric salaries fall back to inference."""
+        csv = tmp_path / "odd_values.csv"
+        csv.write_text(
+            "id,name,salary\n"
+            "3000000000,John Doe,$50000\n"
+            "2,Jane Smith,65000\n"
+        )
+        df = load_csv(csv)
+        assert df['id'].iloc[0] == 3000000000
+        assert df['salary'].iloc[0] == '$50000'
+
+
+class TestFusedValidation:
+    """Tests that the single-pass validator agrees with the individual checks."""
+    
+    @pytest.mark.parametrize("csv_path", [
+        MESSY_CSV,
+        pytest.param(CLEANED_CSV, marks=pytest.mark.skipif(
+            not CLEANED_CSV.exists(), reason="cleaned_data.csv not found - run UI tests first")),
+    ])
+    def test_fused_matches_individual_checks(self, csv_path):
+        """Verify fused results are identical to run_all_validations."""
+        df = load_csv(csv_path)
+        assert run_all_validations_fused(df) == run_all_validations(df)
+    
+    def test_fused_reports_missing_columns(self):
+        """Verify fused validation still reports missing columns per check."""
+        df = load_csv(MESSY_CSV).drop(columns=['status', 'salary'])
+        assert run_all_validations_fused(df) == run_all_validations(df)
+    
+    @pytest.mark.parametrize("names, expected", [
+        (['Alice', 'Bob', None], True),
+        (['Alice', None, 'Bob'], False),
+    ])
+    def test_missing_names_sort_last(self, names, expected):
+        """Verify trailing missing names still count as sorted, like sort_values."""
+        df = pd.DataFrame({'name': pd.Series(names, dtype=object), 'age': [1.0, 2.0, 3.0],
+                           'salary': [1.0, 2.0, 3.0], 'status': ['active'] * 3})
+        passed, _ = validate_sorted(df, 'name', ascending=True)
+        assert passed is expected
+        assert run_all_validations_fused(df) == run_all_validations(df)
+    
+    def test_mixed_type_names(self):
+        """Verify mixed-type name columns are reported, not raised, by the fused path."""
+        df = pd.DataFrame({'name': pd.Series(['a', 3], dtype=object), 'age': [1.0, 2.0],
+                           'salary': [1.0, 2.0], 'status': ['active'] * 2})
+        assert run_all_validations_fused(df) == run_all_validations(df)
+    
+    def test_specialized_validator_matches_individual_checks(self, messy_df):
+        """Verify the layout-specialized validator gives identical results."""
+        validate = make_validator(EXPECTED_LAYOUT)
+        assert validate is make_validator(EXPECTED_LAYOUT)
+        assert validate(messy_df) == run_all_validations(messy_df)
+    
+    def test_specialized_validator_handles_other_layouts(self, messy_df):
+        """Verify frames with a different column order fall back correctly."""
+        df = messy_df[list(reversed(EXPECTED_LAYOUT))]
+        assert make_validator(EXPECTED_LAYOUT)(df) == run_all_validations(df)
+
+
+class TestNumbaKernels:
+    """Tests for the optional Numba kernels used by the fused validator."""
+    
+    @pytest.fixture
+    def kernels(self):
+        pytest.importorskip("numba")
+        import validator_numba
+        return validator_numba
+    
+    def test_count_nulls_matches_pandas(self, kernels, messy_df):
+        """Verify the NaN count matches isna()."""
+        for col in ('age', 'salary'):
+            values = messy_df[col].to_numpy(dtype=np.float64, na_value=np.nan)
+            assert kernels.count_nulls_f64(values) == messy_df[col].isna().sum() == 5
+    
+    def test_fused_with_numba_matches_individual_checks(self, kernels, messy_df, monkeypatch):
+        """Verify the Numba path of the fused validator gives identical results."""
+        import validator
+        monkeypatch.setattr(validator, 'NUMBA_MIN_ROWS', 0)
+        # The kernel only handles plain float64 columns; Arrow ones use isna()
+        df = messy_df.astype({'age': 'float64', 'salary': 'float64'})
+        assert run_all_validations_fused(df) == run_all_validations(df)
+    
+    def test_numba_not_imported_for_small_files(self):
+        """Verify the CLI path doesn't pay numba's import cost below NUMBA_MIN_ROWS."""
+        script = (
+            "import sys, validator; "
+            "validator.make_validator(validator.EXPECTED_LAYOUT)(validator.load_csv(sys.argv[1])); "
+            "assert 'numba' not in sys.modules"
+        )
+        subprocess.run([sys.executable, "-c", script, str(MESSY_CSV)],
+                       cwd=Path(__file__).parent, check=True)
 
 
 if __name__ == "__main__":
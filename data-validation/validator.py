@@ -16,17 +16,153 @@ Example:
     python validator.py ../test-results/downloads/cleaned_data.csv
 """
 
+import functools
+import re
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import sys
 import os
-from typing import Tuple, List, Dict, Any
+from typing import Callable, Optional, Tuple, List, Dict, Any
+
+try:
+    import hyperscan
+except ImportError:  # hyperscan is optional; plain re is used instead
+    hyperscan = None
+
+
+# Column layout of the pipeline's input and output CSVs
+EXPECTED_LAYOUT = ('id', 'name', 'email', 'age', 'salary', 'department', 'status')
+EXPECTED_COLUMNS = frozenset(EXPECTED_LAYOUT)
+
+# Columns the fused validators read directly
+_FUSED_COLUMNS = frozenset({'name', 'age', 'salary', 'status'})
+
+# Low-cardinality text columns, loaded as categoricals so that checks run
+# over the handful of unique values instead of every row
+CATEGORICAL_COLUMNS = ('status', 'department')
+
+# Numeric columns that can safely be narrowed, halving the bytes the null,
+# duplicate and schema scans touch. Arrow-backed, so missing values don't
+# force a float upcast. age/salary stay 64-bit: float32 can't hold cents
+# above $131,072, which would merge distinct salaries into duplicates.
+NUMERIC_DTYPES = {'id': 'int32[pyarrow]'}
+
+EMAIL_PATTERN = r'^[\w\.-]+@[\w\.-]+\.\w+$'
+_EMAIL_RE = re.compile(EMAIL_PATTERN)
+
+# EMAIL_PATTERN spelled so RE2 reads it the way re does: RE2's \w is
+# ASCII-only, and its $ doesn't allow the single trailing newline re.match does
+_EMAIL_PATTERN_RE2 = r'^[\p{L}\p{N}_.-]+@[\p{L}\p{N}_.-]+\.[\p{L}\p{N}_]+\n?$'
+
+# Row count from which the fused validator loads the Numba null-count kernel.
+# Importing numba and loading the cached kernel costs ~0.3s once per process;
+# on float64 columns the kernel then saves ~0.75ns per row per column over
+# isna().sum() (10M rows: 2.9ms vs 10.5ms). With age and salary that breaks
+# even around 200M rows. Arrow-backed columns, which load_csv produces, count
+# nulls from their validity bitmap and never use the kernel.
+NUMBA_MIN_ROWS = 200_000_000
 
 
 def load_csv(filepath: str) -> pd.DataFrame:
-    """Load a CSV file into a pandas DataFrame."""
+    """
+    Load a CSV file into a pandas DataFrame.
+    Parsed frames are cached per path and modification time, so repeated
+    loads of an unchanged file skip the parse. Each call gets its own deep
+    copy (still far cheaper than re-parsing), so callers can't change what
+    later loads see, with or without pandas' copy-on-write.
+    """
     if not os.path.exists(filepath):
         raise FileNotFoundError(f"File not found: {filepath}")
-    return pd.read_csv(filepath)
+    return _read_csv(os.path.abspath(filepath), os.path.getmtime(filepath)).copy(deep=True)
+
+
+@functools.lru_cache(maxsize=8)
+def _read_csv(filepath: str, mtime: float) -> pd.DataFrame:
+    # The pyarrow engine parses multi-threaded straight into Arrow buffers, and
+    # the pyarrow dtype backend keeps strings there so .str methods, isna()
+    # and friends dispatch to Arrow compute kernels. Explicit dtypes skip
+    # inference for the numeric and categorical columns (entries for columns
+    # absent from the file are ignored).
+    categorical = dict.fromkeys(CATEGORICAL_COLUMNS, 'category')
+    try:
+        df = pd.read_csv(
+            filepath,
+            engine='pyarrow',
+            dtype_backend='pyarrow',
+            dtype={**NUMERIC_DTYPES, **categorical},
+        )
+    except ValueError:
+        # Values that don't fit the declared types (ids past int32, text in
+        # a numeric column, an all-empty categorical column) fall back to
+        # inference, so bad data fails its checks instead of the whole load
+        df = _match_c_engine(pd.read_csv(filepath, engine='pyarrow', dtype_backend='pyarrow'))
+        for col in CATEGORICAL_COLUMNS:
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+        return df
+    return _match_c_engine(df)
+
+
+def _match_c_engine(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Smooth over where the pyarrow engine differs from the C parser, so odd
+    files fail individual checks instead of crashing the report.
+    """
+    # Duplicate headers: the C parser renames repeats to 'x.1', 'x.2', ...
+    # while pyarrow keeps them, which makes df['x'] return a DataFrame
+    if not df.columns.is_unique:
+        seen = set()
+        names = []
+        for col in df.columns:
+            name, n = col, 0
+            while name in seen:
+                n += 1
+                name = f"{col}.{n}"
+            seen.add(name)
+            names.append(name)
+        df.columns = names
+    
+    # Columns with no values at all (e.g. a header-only file) come back as
+    # null[pyarrow], which the .str accessor rejects; read them as strings
+    string = pd.ArrowDtype(pa.string())
+    for col in df.columns:
+        dtype = df[col].dtype
+        if isinstance(dtype, pd.ArrowDtype) and pa.types.is_null(dtype.pyarrow_dtype):
+            df[col] = df[col].astype(string)
+        elif isinstance(dtype, pd.CategoricalDtype):
+            cats_dtype = dtype.categories.dtype
+            if isinstance(cats_dtype, pd.ArrowDtype) and pa.types.is_null(cats_dtype.pyarrow_dtype):
+                df[col] = df[col].cat.set_categories(dtype.categories.astype(string))
+    return df
+
+
+def _count_non_lowercase(col: pd.Series) -> int:
+    """Count values in a text column that are not already lowercase."""
+    if isinstance(col.dtype, pd.CategoricalDtype):
+        # Check the categories once, then map the result back onto rows via
+        # the integer codes (code -1 marks a missing value, never lowercase)
+        cats = col.cat.categories
+        bad_cats = np.asarray(cats.str.lower() != cats)
+        codes = col.cat.codes.to_numpy()
+        return int(np.append(bad_cats, True)[codes].sum())
+    
+    # Fast path: a single C-level pass when every value is already lowercase
+    if col.notna().all() and col.str.islower().all():
+        return 0
+    
+    # Count mismatches on the raw arrays instead of slicing the DataFrame;
+    # missing values never count as lowercase
+    lowered = col.str.lower().to_numpy(dtype=object, na_value=None)
+    values = col.to_numpy(dtype=object, na_value=None)
+    return int((lowered != values).sum()) + int(col.isna().sum())
+
+
+def _text_case_result(column: str, mismatches: int) -> Tuple[bool, str]:
+    if mismatches > 0:
+        return False, f"Found {mismatches} rows with non-lowercase {column}"
+    return True, f"✓ All {column} values are lowercase"
 
 
 def validate_text_case(df: pd.DataFrame, column: str = 'status') -> Tuple[bool, str]:
@@ -37,13 +173,13 @@ def validate_text_case(df: pd.DataFrame, column: str = 'status') -> Tuple[bool,
     if column not in df.columns:
         return False, f"Column '{column}' not found in dataset"
     
-    # Check if all values are lowercase
-    non_lowercase = df[df[column].str.lower() != df[column]]
-    
-    if len(non_lowercase) > 0:
-        return False, f"Found {len(non_lowercase)} rows with non-lowercase {column}"
-    
-    return True, f"✓ All {column} values are lowercase"
+    return _text_case_result(column, _count_non_lowercase(df[column]))
+
+
+def _null_result(col: str, null_count: int) -> Tuple[bool, str]:
+    if null_count > 0:
+        return False, f"✗ {col}: {null_count} NULL values found"
+    return True, f"✓ {col}: No NULL values"
 
 
 def validate_no_nulls(df: pd.DataFrame, columns: List[str] = ['age', 'salary']) -> Tuple[bool, str]:
@@ -59,29 +195,69 @@ def validate_no_nulls(df: pd.DataFrame, columns: List[str] = ['age', 'salary'])
             results.append(f"Column '{col}' not found")
             all_valid = False
             continue
-            
-        null_count = df[col].isna().sum()
-        if null_count > 0:
-            results.append(f"✗ {col}: {null_count} NULL values found")
-            all_valid = False
-        else:
-            results.append(f"✓ {col}: No NULL values")
+        
+        null_count = int(df[col].isna().sum())
+        passed, message = _null_result(col, null_count)
+        results.append(message)
+        all_valid = all_valid and passed
     
     return all_valid, "\n".join(results)
 
 
+def any_duplicates(df: pd.DataFrame) -> bool:
+    """
+    Return True if any row is repeated.
+    For callers that only need a yes/no answer rather than a count.
+    """
+    # duplicated() factorizes per column in C; hashing rows for an early-exit
+    # Python loop costs more than that and merges values like 1 and '1'
+    return bool(df.duplicated().any())
+
+
+def _duplicates_result(duplicate_count: int, total: int) -> Tuple[bool, str]:
+    if duplicate_count > 0:
+        return False, f"✗ Found {duplicate_count} duplicate rows"
+    return True, f"✓ No duplicate rows (total: {total} rows)"
+
+
 def validate_no_duplicates(df: pd.DataFrame) -> Tuple[bool, str]:
     """
     Validate Remove Duplicates transformation.
     No duplicate rows should exist.
     """
-    duplicates = df.duplicated()
-    duplicate_count = duplicates.sum()
-    
-    if duplicate_count > 0:
-        return False, f"✗ Found {duplicate_count} duplicate rows"
+    # duplicated() factorizes column by column, which is both faster than
+    # hashing whole rows first and exact for mixed-type object columns
+    return _duplicates_result(int(df.duplicated().sum()), len(df))
+
+
+def _first_unsorted_row(col: pd.Series, ascending: bool = True) -> Optional[int]:
+    """
+    Position of the first row that is not where a stable sort would put it,
+    or None if the rows are already in sort_values() order (missing values
+    last). Only the int64 sort permutation is allocated; the sorted values
+    themselves never are.
+    """
+    codes, _ = pd.factorize(col.to_numpy(), sort=True)
+    keys = codes if ascending else codes.max() - codes
+    keys[codes < 0] = len(codes)  # missing values sort last, like sort_values
+    order = np.argsort(keys, kind='stable')
+    mismatches = np.flatnonzero(order != np.arange(order.size))
+    return int(mismatches[0]) if mismatches.size else None
+
+
+def _sorted_result(column: str, ascending: bool, is_sorted: bool,
+                   col: pd.Series) -> Tuple[bool, str]:
+    if is_sorted:
+        direction = "ascending" if ascending else "descending"
+        return True, f"✓ Data is sorted by {column} ({direction})"
     
-    return True, f"✓ No duplicate rows (total: {len(df)} rows)"
+    # The monotonic checks fail on any missing value, so confirm against the
+    # sort permutation (which puts missing values last, like sort_values)
+    # and use it to explain a real failure
+    first = _first_unsorted_row(col, ascending)
+    if first is None:
+        return _sorted_result(column, ascending, True, col)
+    return False, f"✗ Data is NOT sorted by {column} (first out-of-place row: {first + 1})"
 
 
 def validate_sorted(df: pd.DataFrame, column: str = 'name', ascending: bool = True) -> Tuple[bool, str]:
@@ -92,14 +268,11 @@ def validate_sorted(df: pd.DataFrame, column: str = 'name', ascending: bool = Tr
     if column not in df.columns:
         return False, f"Column '{column}' not found in dataset"
     
-    sorted_values = df[column].sort_values(ascending=ascending).reset_index(drop=True)
-    actual_values = df[column].reset_index(drop=True)
+    # One O(n) sweep with early exit instead of sorting a copy to compare
+    col = df[column]
+    is_sorted = col.is_monotonic_increasing if ascending else col.is_monotonic_decreasing
     
-    if sorted_values.equals(actual_values):
-        direction = "ascending" if ascending else "descending"
-        return True, f"✓ Data is sorted by {column} ({direction})"
-    
-    return False, f"✗ Data is NOT sorted by {column}"
+    return _sorted_result(column, ascending, is_sorted, col)
 
 
 def validate_row_count(df: pd.DataFrame, expected_min: int = 24, expected_max: int = 25) -> Tuple[bool, str]:
@@ -119,14 +292,13 @@ def validate_schema(df: pd.DataFrame) -> Tuple[bool, str]:
     """
     Validate the output schema matches expected columns.
     """
-    expected_columns = {'id', 'name', 'email', 'age', 'salary', 'department', 'status'}
     actual_columns = set(df.columns)
     
-    if expected_columns == actual_columns:
+    if EXPECTED_COLUMNS == actual_columns:
         return True, f"✓ Schema matches: {len(actual_columns)} columns"
     
-    missing = expected_columns - actual_columns
-    extra = actual_columns - expected_columns
+    missing = set(EXPECTED_COLUMNS - actual_columns)
+    extra = actual_columns - EXPECTED_COLUMNS
     
     msg = "✗ Schema mismatch:"
     if missing:
@@ -137,6 +309,63 @@ def validate_schema(df: pd.DataFrame) -> Tuple[bool, str]:
     return False, msg
 
 
+@functools.lru_cache(maxsize=None)
+def _email_database():
+    """Compile EMAIL_PATTERN into a Hyperscan database once per process."""
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[EMAIL_PATTERN.encode()],
+        ids=[0],
+        # MULTILINE anchors ^/$ at line breaks so one scan covers a whole
+        # newline-joined column; UTF8|UCP keeps \w Unicode-aware like re
+        flags=[hyperscan.HS_FLAG_MULTILINE | hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP],
+    )
+    return db
+
+
+def _count_invalid_emails(col: pd.Series) -> int:
+    """Count values not matching EMAIL_PATTERN; missing values never match."""
+    if isinstance(col.dtype, pd.ArrowDtype):
+        # RE2-backed match straight over the Arrow buffer: linear time, no
+        # backtracking and no per-cell Python call
+        matched = pc.match_substring_regex(pa.array(col), _EMAIL_PATTERN_RE2)
+        return int((~pc.fill_null(matched, False).to_numpy(zero_copy_only=False)).sum())
+    
+    if hyperscan is not None:
+        # Scan the whole column as one newline-joined buffer through the DFA.
+        # The pattern can't match across a newline, so each valid line reports
+        # exactly one match. Like re's $, a single trailing newline is
+        # allowed; values with other embedded newlines are left out.
+        values = col.dropna().astype(str).str.removesuffix('\n')
+        values = values[~values.str.contains('\n', regex=False)]
+        matched = 0
+        
+        def on_match(*args):
+            nonlocal matched
+            matched += 1
+        
+        _email_database().scan("\n".join(values).encode(), match_event_handler=on_match)
+        return len(col) - matched
+    
+    return int((~col.str.match(_EMAIL_RE).to_numpy(dtype=bool, na_value=False)).sum())
+
+
+def validate_email_format(df: pd.DataFrame, column: str = 'email') -> Tuple[bool, str]:
+    """
+    Validate email format.
+    All values in the specified column should look like an email address.
+    """
+    if column not in df.columns:
+        return False, f"Column '{column}' not found in dataset"
+    
+    invalid = _count_invalid_emails(df[column])
+    
+    if invalid > 0:
+        return False, f"✗ Found {invalid} invalid emails"
+    
+    return True, f"✓ All {column} values are valid emails"
+
+
 def run_all_validations(df: pd.DataFrame) -> Dict[str, Any]:
     """
     Run all validation checks and return results.
@@ -153,6 +382,96 @@ def run_all_validations(df: pd.DataFrame) -> Dict[str, Any]:
     return results
 
 
+@functools.lru_cache(maxsize=None)
+def _numba_kernels():
+    """Import validator_numba on first use; None when numba isn't installed."""
+    try:
+        import validator_numba
+    except ImportError:
+        return None
+    return validator_numba
+
+
+def _fused_checks(df: pd.DataFrame, name: pd.Series, age: pd.Series,
+                  salary: pd.Series, status: pd.Series) -> Dict[str, Any]:
+    """Single-pass body shared by the fused validators, given resolved columns."""
+    kernels = _numba_kernels() if len(df) >= NUMBA_MIN_ROWS else None
+    
+    null_counts = []
+    for col in (age, salary):
+        if kernels is not None and col.dtype == np.float64:
+            # Plain NumPy float64 column: count in place, no conversion
+            null_counts.append(kernels.count_nulls_f64(col.to_numpy()))
+        else:
+            null_counts.append(col.isna().sum())
+    age_ok, age_msg = _null_result('age', int(null_counts[0]))
+    salary_ok, salary_msg = _null_result('salary', int(null_counts[1]))
+    
+    # A single C pass that, unlike a raw element-wise comparison, copes with
+    # mixed-type object columns; _sorted_result accepts trailing missing names
+    sorted_check = _sorted_result('name', True, name.is_monotonic_increasing, name)
+    
+    duplicate_count = int(df.duplicated().sum())
+    
+    return {
+        'row_count': validate_row_count(df),
+        'text_case': _text_case_result('status', _count_non_lowercase(status)),
+        'no_nulls': (age_ok and salary_ok, f"{age_msg}\n{salary_msg}"),
+        'no_duplicates': _duplicates_result(duplicate_count, len(df)),
+        'sorted': sorted_check,
+    }
+
+
+def run_all_validations_fused(df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Run all validation checks in a single pass over the needed columns.
+    
+    Produces the same results as run_all_validations(), but resolves each
+    checked column once and shares it across the checks instead of letting
+    every check look it up again. Very large float64 frames use the Numba
+    null-count kernel from validator_numba when numba is installed.
+    """
+    if not _FUSED_COLUMNS.issubset(df.columns):
+        # Per-check "column not found" messages come from the plain validators
+        return run_all_validations(df)
+    
+    return {
+        'schema': validate_schema(df),
+        **_fused_checks(df, df['name'], df['age'], df['salary'], df['status']),
+    }
+
+
+@functools.lru_cache(maxsize=None)
+def make_validator(expected_columns: Tuple[str, ...]) -> Callable[[pd.DataFrame], Dict[str, Any]]:
+    """
+    Build a fused validator specialized for one fixed column layout.
+    
+    Everything that depends only on the layout is resolved once here: the
+    schema check result and the position of each checked column. The
+    returned function only confirms the layout with a tuple comparison and
+    then reads columns by position. Frames with any other layout fall back
+    to run_all_validations_fused(). Validators are cached per layout.
+    """
+    if not _FUSED_COLUMNS.issubset(expected_columns):
+        return run_all_validations_fused
+    
+    schema_result = validate_schema(pd.DataFrame(columns=list(expected_columns)))
+    i_name, i_age, i_salary, i_status = (
+        expected_columns.index(col) for col in ('name', 'age', 'salary', 'status')
+    )
+    
+    def validate(df: pd.DataFrame) -> Dict[str, Any]:
+        if tuple(df.columns) != expected_columns:
+            return run_all_validations_fused(df)
+        return {
+            'schema': schema_result,
+            **_fused_checks(df, df.iloc[:, i_name], df.iloc[:, i_age],
+                            df.iloc[:, i_salary], df.iloc[:, i_status]),
+        }
+    
+    return validate
+
+
 def print_report(results: Dict[str, Any]) -> bool:
     """
     Print validation report and return overall pass/fail.
@@ -194,7 +513,7 @@ def main():
         df = load_csv(filepath)
         print(f"Loaded {len(df)} rows, {len(df.columns)} columns")
         
-        results = run_all_validations(df)
+        results = make_validator(EXPECTED_LAYOUT)(df)
         all_passed = print_report(results)
         
         sys.exit(0 if all_passed else 1)
@@ -0,0 +1,25 @@
+"""
+Numba-compiled kernels for the fused validator.
+
+These back run_all_validations_fused() in validator.py on very large
+frames. numba is an optional dependency: validator.py only imports this
+module once a frame reaches NUMBA_MIN_ROWS, and keeps the pandas code
+path when numba is not installed.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True, parallel=True)
+def count_nulls_f64(values):
+    """
+    Count NaN values in a 1-D float64 array.
+    Reduces in place across cores, without the temporary boolean array
+    np.isnan(values).sum() allocates.
+    """
+    n = 0
+    for i in prange(values.shape[0]):
+        if np.isnan(values[i]):
+            n += 1
+    return n